@@ -1,8 +1,13 @@
 # ===== Importing external modules ===========
-from datetime import datetime
-import re
+from datetime import date, datetime
+from collections import Counter, defaultdict
+from itertools import compress
+import string
 import logging
+import mmap
 import shutil
+import sys
+import time
 import os
 
 # ===== File Path Constants =====
@@ -12,6 +17,42 @@ TASK_OVERVIEW_FILE = "task_overview.txt"
 USER_OVERVIEW_FILE = "user_overview.txt"
 LOG_FILE = "task_manager.log"
 
+# ===== In-Memory Caches =====
+# Parsed user.txt keyed by username -> (password, role), refreshed on file change
+_USER_CACHE = {}
+_USER_CACHE_MTIME = None
+# Bloom filter over the cached usernames, stored as a fixed-size bit array
+_USER_BLOOM_BITS = 8192
+_USER_BLOOM = bytearray(_USER_BLOOM_BITS // 8)
+_USER_BLOOM_HASHES = 3
+# Next free task ID, valid while task.txt keeps the recorded mtime/size
+_NEXT_TASK_ID = None
+_NEXT_TASK_ID_MTIME = None
+# Parsed task.txt rows (7-tuples, file order) with task_id -> row index and
+# username -> [row indices] lookups, valid while task.txt keeps the recorded mtime/size.
+# "users" and "status" are per-row columns: the assigned username and the
+# normalized completion flag ('yes'/'no').
+# "offsets" is a per-row column of status field byte offsets (None where the
+# field cannot be patched in place) and "due" holds each row's parsed due date
+# (or None); both are built on demand. "stats" memoizes the report aggregation
+# as (date, totals, per_user).
+_TASK_CACHE = {"mtime": None, "rows": [], "by_id": {}, "by_user": defaultdict(list), "users": [],
+               "status": [], "offsets": None, "due": None, "stats": None}
+
+# Width of the status field in task.txt; "No" is padded to "No " so a status
+# flip always rewrites exactly this many bytes
+STATUS_WIDTH = 3
+
+# Today's date, keyed by the wall-clock second it was computed in
+_TODAY_CACHE = (None, None)
+
+# Field order of a task record in task.txt
+TASK_FIELDS = ("task_id", "username", "title", "description", "due_date", "assigned_date", "complete")
+
+# ===== Validation Patterns =====
+# Characters allowed in a username: ASCII letters, digits and underscores
+_USERNAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
 # ===== Logging Configuration =====
 logging.basicConfig(
     filename=LOG_FILE,
@@ -50,13 +91,15 @@ class User:
         """
         return f"{self.username}, {self.password}, {self.role}"
     
-    def display_info(self):
+    def format_info(self):
         """
-        Display user information in formatted tabular output.
+        Return user information as formatted tabular text (no trailing newline).
         """
-        print(f"  {'Username':<30} | {self.username}")
-        print(f"  {'Role':<30} | {self.role}")
-        print("  " + "-" * 76)
+        return (
+            f"  {'Username':<30} | {self.username}\n"
+            f"  {'Role':<30} | {self.role}\n"
+            "  " + "-" * 76
+        )
 
 
 
@@ -64,6 +107,18 @@ class User:
 
 # ===== Validation Functions =====
 
+def _today():
+    """
+    Return today's date, recomputed at most once per second.
+    Avoids building a new datetime for every due date validated.
+    """
+    global _TODAY_CACHE
+    second = int(time.time())
+    if _TODAY_CACHE[0] != second:
+        _TODAY_CACHE = (second, datetime.now().date())
+    return _TODAY_CACHE[1]
+
+
 def validate_username(username):
     """
     Validate username format.
@@ -76,7 +131,7 @@ def validate_username(username):
         return False, "Username must be at least 3 characters long."
     if len(username) > 20:
         return False, "Username must be no more than 20 characters long."
-    if not re.match(r"^[a-zA-Z0-9_]+$", username):
+    if not _USERNAME_CHARS.issuperset(username):
         return False, "Username can only contain letters, numbers, and underscores."
     return True, ""
 
@@ -94,36 +149,40 @@ def validate_password(password):
     return True, ""
 
 
-def validate_date_format(date_string):
+def parse_date(date_string):
     """
-    Validate date format (YYYY-MM-DD).
-    Returns: (is_valid, error_message)
+    Validate date format (YYYY-MM-DD) and return the parsed date.
+    Returns: (is_valid, error_message, date or None)
     """
     if not date_string:
-        return False, "Date cannot be empty."
+        return False, "Date cannot be empty.", None
     try:
-        datetime.strptime(date_string, "%Y-%m-%d")
-        return True, ""
+        return True, "", datetime.strptime(date_string, "%Y-%m-%d").date()
     except ValueError:
-        return False, "Invalid date format. Please use YYYY-MM-DD."
+        return False, "Invalid date format. Please use YYYY-MM-DD.", None
+
+
+def validate_date_format(date_string):
+    """
+    Validate date format (YYYY-MM-DD).
+    Returns: (is_valid, error_message)
+    """
+    is_valid, error_msg, _ = parse_date(date_string)
+    return is_valid, error_msg
 
 
 def validate_due_date(date_string):
     """
     Validate due date is in correct format and not in the past.
+    The date string is parsed only once.
     Returns: (is_valid, error_message)
     """
-    is_valid, error_msg = validate_date_format(date_string)
+    is_valid, error_msg, due_date = parse_date(date_string)
     if not is_valid:
         return False, error_msg
-    
-    try:
-        due_date = datetime.strptime(date_string, "%Y-%m-%d").date()
-        if due_date < datetime.now().date():
-            return False, "Due date cannot be in the past."
-        return True, ""
-    except ValueError:
-        return False, "Invalid date format. Please use YYYY-MM-DD."
+    if due_date < _today():
+        return False, "Due date cannot be in the past."
+    return True, ""
 
 
 def validate_non_empty(input_string, field_name):
@@ -169,6 +228,22 @@ def get_validated_input(prompt, validator_func, field_name):
         return user_input
 
 
+def ask_yes_no(prompt):
+    """
+    Ask a y/n question and return True if the answer starts with 'y'.
+    Reads straight from stdin; end of input counts as 'no'.
+    
+    Args:
+        prompt (str): The question to display
+    
+    Returns:
+        bool: True for yes, False otherwise
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()[:1].casefold() == "y"
+
+
 def handle_file_error(operation, error):
     """
     Helper function to handle and display file I/O errors.
@@ -183,9 +258,81 @@ def handle_file_error(operation, error):
     logging.error(f"File operation failed - {operation}: {error}")
 
 
+def _load_users():
+    """
+    Return the cached user index, rebuilding it if user.txt has changed.
+    Users in the old format (username, password) are stored with a role of None.
+    
+    Returns:
+        dict: Mapping of username -> (password, role)
+    
+    Raises:
+        FileNotFoundError: If user.txt does not exist
+    """
+    global _USER_CACHE, _USER_CACHE_MTIME, _USER_BLOOM
+    stat = os.stat(USER_FILE)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if signature != _USER_CACHE_MTIME:
+        with open(USER_FILE, "r") as user_file:
+            lines = user_file.read().splitlines()
+        users = {}
+        for line in lines:
+            user_data = line.strip().split(", ")
+            if len(user_data) == 3:
+                users[user_data[0]] = (user_data[1], user_data[2])
+            elif len(user_data) == 2:
+                users[user_data[0]] = (user_data[1], None)
+        bloom = bytearray(_USER_BLOOM_BITS // 8)
+        for username in users:
+            for position in _bloom_positions(username):
+                bloom[position >> 3] |= 1 << (position & 7)
+        _USER_CACHE = users
+        _USER_BLOOM = bloom
+        _USER_CACHE_MTIME = signature
+    return _USER_CACHE
+
+
+def _bloom_positions(username):
+    """
+    Return the bit positions a username sets in the user Bloom filter.
+    """
+    return [hash((salt, username)) % _USER_BLOOM_BITS for salt in range(_USER_BLOOM_HASHES)]
+
+
+def _invalidate_user_cache():
+    """
+    Force the next _load_users() call to re-read user.txt.
+    """
+    global _USER_CACHE_MTIME
+    _USER_CACHE_MTIME = None
+
+
+def _scan_user_file(username):
+    """
+    Search user.txt for a username without building the user index.
+    The file is memory-mapped and searched for the line prefix
+    "<username>, " in a single C-level scan.
+    
+    Args:
+        username (str): Username to find
+        
+    Returns:
+        bool: True if a line for the user exists, False otherwise
+    """
+    needle = (username + ", ").encode()
+    with open(USER_FILE, "rb") as user_file:
+        if os.fstat(user_file.fileno()).st_size == 0:
+            return False  # mmap cannot map an empty file
+        with mmap.mmap(user_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:len(needle)] == needle or mm.find(b"\n" + needle) != -1
+
+
 def user_exists(username):
     """
     Check if username exists in user.txt.
+    Uses the user index (behind a Bloom filter for fast negatives) when it
+    is up to date; otherwise scans the memory-mapped file directly rather
+    than rebuilding the index for a single lookup.
     
     Args:
         username (str): Username to check
@@ -193,13 +340,18 @@ def user_exists(username):
     Returns:
         bool: True if user exists, False otherwise
     """
-    try:
-        with open(USER_FILE, "r") as user_file:
-            for line in user_file:
-                existing_user = line.strip().split(", ")[0]
-                if existing_user == username:
-                    return True
+    # No stored username can contain the field separator or a line break;
+    # rejecting them here keeps the file scan in agreement with the index
+    if ", " in username or "\n" in username or "\r" in username:
         return False
+    try:
+        if _file_signature(USER_FILE) == _USER_CACHE_MTIME:
+            # A clear bit in the Bloom filter means the user is definitely absent
+            for position in _bloom_positions(username):
+                if not _USER_BLOOM[position >> 3] >> (position & 7) & 1:
+                    return False
+            return username in _USER_CACHE
+        return _scan_user_file(username)
     except FileNotFoundError:
         return False
 
@@ -207,6 +359,13 @@ def user_exists(username):
 def backup_file(filename):
     """
     Create timestamped backup of file before destructive operations.
+    The backup is a hard link to the current file, so no data is copied.
+    This is safe because files are only ever rewritten by renaming a
+    temporary file over them (_atomic_write(), delete_task()), which swaps
+    in a new inode, appended to via _append_line() (which detaches from any
+    backup link first), or patched by _write_status_in_place(), which
+    refuses to write when the file has more than one link. Falls back to a
+    byte copy on filesystems without hard link support.
     
     Args:
         filename (str): File to backup
@@ -217,7 +376,14 @@ def backup_file(filename):
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"{filename}.backup_{timestamp}"
-        shutil.copy2(filename, backup_name)
+        try:
+            os.remove(backup_name)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(filename, backup_name)
+        except OSError:
+            shutil.copy2(filename, backup_name)
         logging.info(f"Backup created: {backup_name}")
         return True
     except Exception as e:
@@ -236,19 +402,15 @@ def login_user():
     password = input("Enter your password: ")
     
     try:
-        with open(USER_FILE, "r") as user_file:
-            for line in user_file:
-                user_data = line.strip().split(", ")
-                if len(user_data) == 3:
-                    file_username, file_password, role = user_data
-                    if file_username == username and file_password == password:
-                        user = User(file_username, file_password, role)
-                        print_header("SUCCESS")
-                        print(f"  Welcome, {user.username}!")
-                        print(f"  Role: {user.role}")
-                        print()
-                        logging.info(f"User {username} logged in successfully")
-                        return user
+        creds = _load_users().get(username)
+        if creds is not None and creds[1] is not None and creds[0] == password:
+            user = User(username, creds[0], creds[1])
+            print_header("SUCCESS")
+            print(f"  Welcome, {user.username}!")
+            print(f"  Role: {user.role}")
+            print()
+            logging.info(f"User {username} logged in successfully")
+            return user
         
         # Authentication failed
         print_header("ERROR")
@@ -332,11 +494,12 @@ def verify_and_update_user_roles():
                 # New format: username, password, role (already has role)
                 updated_lines.append(line)
         
-        # If updates were made, save the updated file
+        # If updates were made, back up the old-format file and atomically
+        # replace it; nothing is copied or rewritten when all roles exist
         if needs_update:
             backup_file(USER_FILE)
-            with open(USER_FILE, "w") as user_file:
-                user_file.writelines(updated_lines)
+            _atomic_write(USER_FILE, "".join(updated_lines))
+            _invalidate_user_cache()
             print_header("SUCCESS")
             print("  All users have been updated with roles!")
             print()
@@ -370,17 +533,7 @@ def register_user():
             print(f"Error: {error_msg}")
             continue
         # Check if username already exists
-        username_exists = False
-        try:
-            with open(USER_FILE, "r") as user_file:
-                for line in user_file:
-                    existing_user = line.strip().split(", ")[0]
-                    if existing_user == username:
-                        username_exists = True
-                        break
-        except FileNotFoundError:
-            pass  # File doesn't exist yet, so username is unique
-        if username_exists:
+        if user_exists(username):
             print(f"Error: Username '{username}' already exists. Please try a different username.")
             continue
         else:
@@ -422,8 +575,8 @@ def register_user():
     # Create User object with plain text password
     new_user = User(username, password, role)
     try:
-        with open(USER_FILE, "a") as user_file:
-            user_file.write(str(new_user) + "\n")
+        _append_line(USER_FILE, str(new_user) + "\n")
+        _invalidate_user_cache()
         print_header("SUCCESS")
         print(f"  User '{new_user.username}' successfully created!")
         print(f"  Role: {new_user.role}")
@@ -433,26 +586,125 @@ def register_user():
         handle_file_error("saving user", e)
 
 
+def _file_signature(filename):
+    """
+    Return (mtime_ns, size) for a file, or None if it does not exist.
+    Used to detect external edits to cached files.
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _atomic_write(filename, body):
+    """
+    Replace the contents of a file atomically.
+    The body is written to a temporary file in one write, flushed to disk
+    once, then renamed over the original so a crash never leaves a
+    half-written file behind.
+    
+    Args:
+        filename (str): File to replace
+        body (str): Complete new file contents
+    """
+    tmp_name = filename + ".tmp"
+    try:
+        with open(tmp_name, "w") as tmp_file:
+            tmp_file.write(body)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_name, filename)
+    except Exception:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_write_bytes(filename, payload):
+    """
+    Replace the contents of a file with already-encoded bytes.
+    The payload goes to a temporary file through a raw descriptor, so
+    there is no text-layer encoding or buffering, then is renamed over
+    the original. Used for the generated reports, which are rebuilt on
+    demand and so are not fsynced.
+    
+    Args:
+        filename (str): File to replace
+        payload (bytes): Complete new file contents
+    """
+    tmp_name = filename + ".tmp"
+    try:
+        fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, filename)
+    except Exception:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _append_line(filename, line):
+    """
+    Append a line to a file without disturbing hard-linked backups.
+    If the file shares its inode with a backup (see backup_file()), it is
+    rewritten atomically with the new line so the backup keeps its
+    snapshot; otherwise the line is simply appended.
+    
+    Args:
+        filename (str): File to append to
+        line (str): Line to append, including its trailing newline
+    """
+    try:
+        linked = os.stat(filename).st_nlink > 1
+    except FileNotFoundError:
+        linked = False
+    if linked:
+        with open(filename, "r") as existing_file:
+            body = existing_file.read()
+        _atomic_write(filename, body + line)
+    else:
+        with open(filename, "a") as append_file:
+            append_file.write(line)
+
+
 def get_next_task_id():
     """
-    Get the next available task ID by reading the task.txt file.
+    Get the next available task ID.
+    The task.txt file is scanned once and the result cached; the scan is
+    repeated only if the file has been changed since the last lookup.
     Handles gaps from deletions by finding the maximum existing ID.
     Returns the next sequential ID (max_id + 1)
     """
-    try:
-        with open(TASK_FILE, "r") as task_file:
-            max_id = 0
-            for line in task_file:
-                task_data = line.strip().split(", ")
-                if len(task_data) == 7:
-                    try:
-                        task_id = int(task_data[0])
-                        max_id = max(max_id, task_id)
-                    except ValueError:
-                        continue
-            return max_id + 1
-    except FileNotFoundError:
-        return 1
+    global _NEXT_TASK_ID, _NEXT_TASK_ID_MTIME
+    signature = _file_signature(TASK_FILE)
+    if _NEXT_TASK_ID is None or signature != _NEXT_TASK_ID_MTIME:
+        max_id = 0
+        try:
+            with open(TASK_FILE, "r") as task_file:
+                for line in task_file:
+                    task_data = line.strip().split(", ")
+                    if len(task_data) == 7:
+                        try:
+                            task_id = int(task_data[0])
+                            max_id = max(max_id, task_id)
+                        except ValueError:
+                            continue
+        except FileNotFoundError:
+            pass
+        _NEXT_TASK_ID = max_id + 1
+        _NEXT_TASK_ID_MTIME = signature
+    return _NEXT_TASK_ID
 
 
 def add_task():
@@ -462,6 +714,8 @@ def add_task():
     Checks that assigned user exists and due date is not in the past.
     Format: task_id, username, title, description, due_date, assigned_date, complete
     """
+    global _NEXT_TASK_ID, _NEXT_TASK_ID_MTIME
+    
     # Validate task username exists
     while True:
         task_username = get_validated_input("Enter the username to assign the task to: ", validate_non_empty, "Username")
@@ -476,12 +730,16 @@ def add_task():
     
     # Get next task ID and save
     task_id = get_next_task_id()
-    current_date = datetime.now().strftime("%Y-%m-%d")
+    current_date = _today().isoformat()
     task_complete = "No"
     
     try:
-        with open(TASK_FILE, "a") as task_file:
-            task_file.write(f"{task_id}, {task_username}, {task_title}, {task_description}, {task_due_date}, {current_date}, {task_complete}\n")
+        _append_line(TASK_FILE, _format_task_line(
+            (str(task_id), task_username, task_title, task_description, task_due_date, current_date, task_complete)
+        ))
+        # Our own append is accounted for, so keep the cached ID valid
+        _NEXT_TASK_ID = task_id + 1
+        _NEXT_TASK_ID_MTIME = _file_signature(TASK_FILE)
         print_header("SUCCESS")
         print(f"  Task '{task_title}' successfully added!")
         print(f"  Task ID: {task_id}")
@@ -492,67 +750,319 @@ def add_task():
         handle_file_error("saving task", e)
 
 
-def display_task(task_id, username, title, description, due_date, assigned_date, complete):
+def format_task(task_id, username, title, description, due_date, assigned_date, complete):
     """
-    Display a single task in formatted tabular output.
+    Format a single task as tabular text (no trailing newline).
     Helper function to reduce code duplication.
     """
-    print(f"  {'Task ID':<20} | {task_id}")
-    print(f"  {'Username':<20} | {username}")
-    print(f"  {'Task Title':<20} | {title}")
-    print(f"  {'Description':<20} | {description}")
-    print(f"  {'Due Date':<20} | {due_date}")
-    print(f"  {'Assigned Date':<20} | {assigned_date}")
-    print(f"  {'Status':<20} | {complete}")
-    print("  " + "-" * 76)
+    return (
+        f"  {'Task ID':<20} | {task_id}\n"
+        f"  {'Username':<20} | {username}\n"
+        f"  {'Task Title':<20} | {title}\n"
+        f"  {'Description':<20} | {description}\n"
+        f"  {'Due Date':<20} | {due_date}\n"
+        f"  {'Assigned Date':<20} | {assigned_date}\n"
+        f"  {'Status':<20} | {complete}\n"
+        "  " + "-" * 76
+    )
 
 
-def display_task_for_user(task_id, username, title, description, due_date, assigned_date, complete):
+def format_task_for_user(task_id, username, title, description, due_date, assigned_date, complete):
     """
-    Display a task for the user's own view (excludes username field).
+    Format a task for the user's own view (excludes username field).
     Helper function for view_my_tasks() in formatted tabular output.
     """
-    print(f"  {'Task ID':<20} | {task_id}")
-    print(f"  {'Task Title':<20} | {title}")
-    print(f"  {'Description':<20} | {description}")
-    print(f"  {'Due Date':<20} | {due_date}")
-    print(f"  {'Assigned Date':<20} | {assigned_date}")
-    print(f"  {'Status':<20} | {complete}")
-    print("  " + "-" * 76)
+    return (
+        f"  {'Task ID':<20} | {task_id}\n"
+        f"  {'Task Title':<20} | {title}\n"
+        f"  {'Description':<20} | {description}\n"
+        f"  {'Due Date':<20} | {due_date}\n"
+        f"  {'Assigned Date':<20} | {assigned_date}\n"
+        f"  {'Status':<20} | {complete}\n"
+        "  " + "-" * 76
+    )
+
+
+def _index_tasks(rows, signature):
+    """
+    Store parsed task rows in the task cache and rebuild its lookup indexes.
+    
+    Args:
+        rows: List of 7-tuples in file order
+        signature: File signature of task.txt the rows correspond to
+    """
+    by_id = {}
+    by_user = defaultdict(list)
+    for index, task_data in enumerate(rows):
+        by_id.setdefault(task_data[0], index)
+        by_user[task_data[1]].append(index)
+    _TASK_CACHE["rows"] = rows
+    _TASK_CACHE["by_id"] = by_id
+    _TASK_CACHE["by_user"] = by_user
+    _TASK_CACHE["users"] = [task_data[1] for task_data in rows]
+    _TASK_CACHE["status"] = [task_data[6].strip().casefold() for task_data in rows]
+    _TASK_CACHE["offsets"] = None
+    _TASK_CACHE["due"] = None
+    _TASK_CACHE["stats"] = None
+    _TASK_CACHE["mtime"] = signature
+
+
+def _parse_due_date(date_string):
+    """
+    Parse a task's due date, returning None if it is not a valid date.
+    Tries the fast date.fromisoformat() first, then the YYYY-MM-DD
+    strptime() format used elsewhere.
+    """
+    try:
+        return date.fromisoformat(date_string)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(date_string, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _due_dates(cache):
+    """
+    Return the parsed due date of every cached task, aligned with the
+    cache's rows. Each date string is parsed once per load of task.txt.
+    
+    Args:
+        cache: Task cache returned by _load_tasks()
+    
+    Returns:
+        List of datetime.date (or None for unparseable dates)
+    """
+    if cache["due"] is None:
+        cache["due"] = [_parse_due_date(task_data[4]) for task_data in cache["rows"]]
+    return cache["due"]
+
+
+def _format_task_line(task_data):
+    """
+    Serialize a task as a task.txt line.
+    The status field is padded to STATUS_WIDTH so it can later be
+    updated in place; the padding is trailing whitespace, which the
+    parser strips.
+    """
+    return ", ".join(task_data[:6]) + ", " + task_data[6].ljust(STATUS_WIDTH) + "\n"
+
+
+def _status_offsets(cache):
+    """
+    Return the byte offset of each cached row's status field in task.txt.
+    Lines are split and filtered with the same 7-field rule as _load_tasks(),
+    so the result lines up with cache["rows"] by index. A row's offset is
+    None unless its status field is already STATUS_WIDTH bytes wide.
+    Computed with one read and cached alongside the parsed rows.
+    
+    Args:
+        cache (dict): Task cache snapshot the offsets must match
+        
+    Returns:
+        list or None: Offset per row, or None if task.txt no longer matches
+                      the snapshot
+    """
+    if cache["offsets"] is None:
+        try:
+            # newline="" keeps line endings so byte positions can be counted
+            with open(TASK_FILE, "r", newline="") as task_file:
+                stat = os.fstat(task_file.fileno())
+                if (stat.st_mtime_ns, stat.st_size) != cache["mtime"]:
+                    return None
+                encoding = task_file.encoding
+                data = task_file.read()
+        except FileNotFoundError:
+            return None
+        offsets = []
+        position = 0
+        for line in data.splitlines(keepends=True):
+            size = len(line.encode(encoding))
+            if len(line.strip().split(", ")) == 7:
+                record = line.rstrip("\r\n")
+                if record.endswith((", Yes", ", No ")):
+                    offsets.append(position + len(record.encode(encoding)) - STATUS_WIDTH)
+                else:
+                    offsets.append(None)
+            position += size
+        if len(offsets) != len(cache["rows"]):
+            return None
+        cache["offsets"] = offsets
+    return cache["offsets"]
+
+
+def _write_status_in_place(cache, index, complete):
+    """
+    Overwrite a task's status field directly in task.txt.
+    
+    Args:
+        cache (dict): Task cache snapshot the row index belongs to
+        index (int): Row index of the task in cache["rows"]
+        complete (str): New status value
+        
+    Returns:
+        bool: True if the status was written, False if the record cannot be
+              patched in place (caller should fall back to a full rewrite)
+    """
+    try:
+        status = complete.ljust(STATUS_WIDTH).encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    if len(status) != STATUS_WIDTH:
+        return False
+    offsets = _status_offsets(cache)
+    if offsets is None or offsets[index] is None:
+        return False
+    with open(TASK_FILE, "r+b") as task_file:
+        stat = os.fstat(task_file.fileno())
+        # A hard-linked backup shares this inode; leave it untouched
+        if stat.st_nlink > 1:
+            return False
+        # The file changed since the snapshot was taken; the offset may be stale
+        if (stat.st_mtime_ns, stat.st_size) != cache["mtime"]:
+            return False
+        task_file.seek(offsets[index])
+        task_file.write(status)
+        task_file.flush()
+        os.fsync(task_file.fileno())
+    return True
+
+
+def _load_tasks():
+    """
+    Return the task cache, re-reading task.txt only if it has changed.
+    """
+    signature = _file_signature(TASK_FILE)
+    if signature != _TASK_CACHE["mtime"]:
+        try:
+            with open(TASK_FILE, "r") as task_file:
+                data = task_file.read()
+        except FileNotFoundError:
+            data = ""
+        # Read the file in one go and split every line in a single comprehension
+        tasks = [tuple(task_data) for task_data in (line.strip().split(", ") for line in data.splitlines())
+                 if len(task_data) == 7]
+        _index_tasks(tasks, signature)
+    return _TASK_CACHE
 
 
 def read_all_tasks():
     """
     Read all tasks from file and return as list of tuples.
+    The file is parsed once and cached until it changes on disk.
     Returns: List of 7-tuples (task_id, username, title, description, due_date, assigned_date, complete)
     """
-    try:
-        with open(TASK_FILE, "r") as task_file:
-            tasks = []
-            for line in task_file:
-                task_data = line.strip().split(", ")
-                if len(task_data) == 7:
-                    tasks.append(tuple(task_data))
-            return tasks
-    except FileNotFoundError:
-        return []
+    return list(_load_tasks()["rows"])
+
+
+def tasks_for(username):
+    """
+    Return the tasks assigned to a user using the cached username index.
+    
+    Args:
+        username (str): Username to look up
+        
+    Returns:
+        List of 7-tuples assigned to the user, in file order
+    """
+    cache = _load_tasks()
+    rows = cache["rows"]
+    return [rows[index] for index in cache["by_user"].get(username, ())]
+
+
+def find_task(task_id):
+    """
+    Look up a task by ID using the cached task_id index.
+    
+    Args:
+        task_id (str): ID of the task to find
+        
+    Returns:
+        tuple or None: The matching 7-tuple, or None if no such task exists
+    """
+    cache = _load_tasks()
+    index = cache["by_id"].get(task_id)
+    return None if index is None else cache["rows"][index]
+
+
+def task_status(task_id):
+    """
+    Return a task's normalized completion flag from the cached status column.
+    
+    Args:
+        task_id (str): ID of the task to check
+        
+    Returns:
+        str or None: 'yes' or 'no' (casefolded), or None if no such task exists
+    """
+    cache = _load_tasks()
+    index = cache["by_id"].get(task_id)
+    return None if index is None else cache["status"][index]
 
 
 def write_all_tasks(tasks):
     """
-    Write all tasks back to file.
+    Write all tasks back to file and refresh the task cache.
     
     Args:
         tasks: List of 7-tuples to write
+        
+    Returns:
+        bool: True if the tasks were saved, False otherwise
     """
+    rows = [tuple(task_data) for task_data in tasks if len(task_data) == 7]
     try:
-        with open(TASK_FILE, "w") as task_file:
-            for task_data in tasks:
-                if len(task_data) == 7:
-                    line = ", ".join(task_data) + "\n"
-                    task_file.write(line)
+        # Build the whole file body first so it goes out in a single write()
+        body = "".join(_format_task_line(task_data) for task_data in rows)
+        _atomic_write(TASK_FILE, body)
     except IOError as e:
+        # False never matches a file signature, so the next read goes back to disk
+        _index_tasks([], False)
         handle_file_error("writing tasks", e)
+        return False
+    _index_tasks(rows, _file_signature(TASK_FILE))
+    return True
+
+
+def patch_task(task_id, **changes):
+    """
+    Update fields of a single task and save task.txt.
+    A status-only change is written in place over the record's status
+    bytes. Any other change modifies the matching row in memory and
+    writes the file back in one go via write_all_tasks().
+    
+    Args:
+        task_id (str): ID of the task to update
+        **changes: New values keyed by field name (e.g. complete="Yes")
+        
+    Returns:
+        tuple or None: The updated task, or None if the task was not found
+                       or could not be saved
+    """
+    cache = _load_tasks()
+    index = cache["by_id"].get(task_id)
+    if index is None:
+        return None
+    task_data = list(cache["rows"][index])
+    for field, value in changes.items():
+        task_data[TASK_FIELDS.index(field)] = value
+    task_data = tuple(task_data)
+    
+    if list(changes) == ["complete"] and _write_status_in_place(cache, index, changes["complete"]):
+        # Only the status bytes changed, so the indexes, offsets and due dates still hold
+        cache["rows"][index] = task_data
+        old_status = cache["status"][index]
+        cache["status"][index] = task_data[6].strip().casefold()
+        _update_stats(cache, index, old_status)
+        cache["mtime"] = _file_signature(TASK_FILE)
+        return task_data
+    
+    rows = list(cache["rows"])
+    rows[index] = task_data
+    if not write_all_tasks(rows):
+        return None
+    return task_data
 
 
 def view_all_tasks():
@@ -570,10 +1080,11 @@ def view_all_tasks():
             print()
         else:
             print_header("ALL TASKS")
-            for task_id, username, title, description, due_date, assigned_date, complete in tasks:
-                display_task(task_id, username, title, description, due_date, assigned_date, complete)
-            print(f"  Total tasks: {len(tasks)}")
-            print()
+            # Build the whole table and emit it with a single write
+            lines = [format_task(*task_data) for task_data in tasks]
+            lines.append(f"  Total tasks: {len(tasks)}")
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
     except IOError as e:
         print_header("ERROR")
         print(f"  Error reading tasks: {e}")
@@ -588,25 +1099,21 @@ def view_all_users():
     Handles file I/O errors gracefully.
     """
     try:
-        with open(USER_FILE, "r") as user_file:
-            users = []
-            for line in user_file:
-                user_data = line.strip().split(", ")
-                if len(user_data) == 3:
-                    username, password, role = user_data
-                    user = User(username, password, role)
-                    users.append(user)
-            
-            if len(users) == 0:
-                print_header("ALL USERS")
-                print("  No users found.")
-                print()
-            else:
-                print_header("ALL USERS")
-                for user in users:
-                    user.display_info()
-                print(f"  Total users: {len(users)}")
-                print()
+        # Users without a role (old format) are not listed, as before
+        users = [User(username, password, role) for username, (password, role) in _load_users().items()
+                 if role is not None]
+        
+        if len(users) == 0:
+            print_header("ALL USERS")
+            print("  No users found.")
+            print()
+        else:
+            print_header("ALL USERS")
+            # Build the whole table and emit it with a single write
+            lines = [user.format_info() for user in users]
+            lines.append(f"  Total users: {len(users)}")
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
     except FileNotFoundError:
         print_header("ALL USERS")
         print("  No users found.")
@@ -618,44 +1125,37 @@ def view_all_users():
         logging.error(f"Error reading users: {e}")
 
 
-def get_valid_task_number(user_tasks):
+def get_valid_task_number(valid_ids):
     """
-    Recursive function to get a valid task ID from the user.
-    Base case: User enters -1 to return to main menu.
-    Recursive case: If user enters invalid task ID or non-integer, recursively call until valid.
+    Prompt until the user enters a valid task ID.
+    Returns None if the user enters -1 (or nothing) to return to the main menu.
+    Re-prompts if the input is not an integer or is not one of the user's tasks.
     
     Args:
-        user_tasks: List of task tuples assigned to the user
+        valid_ids: Set-like collection of task IDs assigned to the user
         
     Returns:
         task_id (str) or None: Valid task ID or None if user enters -1
     """
-    task_id_input = input("  Enter a task ID to update its status/edit (or enter -1 to return): ").strip()
-    
-    # Base case: User enters -1 to return to main menu
-    if task_id_input == "-1":
-        return None
-    
-    # Empty input: Skip
-    if not task_id_input:
-        return None
-    
-    # Validate that input is an integer
-    try:
-        int(task_id_input)
-    except ValueError:
-        print(f"  Error: '{task_id_input}' is not a valid integer. Please enter a task ID or -1 to return.")
-        # Recursive call for invalid input
-        return get_valid_task_number(user_tasks)
-    
-    # Check if task ID exists in user's tasks
-    for task_id, _, _, _, _, _, _ in user_tasks:
-        if task_id == task_id_input:
+    while True:
+        task_id_input = input("  Enter a task ID to update its status/edit (or enter -1 to return): ").strip()
+        
+        # User enters -1 (or nothing) to return to main menu
+        if task_id_input == "-1" or not task_id_input:
+            return None
+        
+        # Validate that input is an integer
+        try:
+            int(task_id_input)
+        except ValueError:
+            print(f"  Error: '{task_id_input}' is not a valid integer. Please enter a task ID or -1 to return.")
+            continue
+        
+        # Check if task ID exists in user's tasks
+        if task_id_input in valid_ids:
             return task_id_input
-    
-    # Task ID not found: Recursive call
-    print(f"  Error: Task ID '{task_id_input}' not found in your tasks.")
-    return get_valid_task_number(user_tasks)
+        
+        print(f"  Error: Task ID '{task_id_input}' not found in your tasks.")
 
 
 def view_my_tasks():
@@ -663,13 +1163,12 @@ def view_my_tasks():
     Display only tasks assigned to the specified user.
     Allows user to select a task by ID to view details, update completion status, or edit task details.
     Tasks can only be edited if they have not been completed.
-    Uses recursive function get_valid_task_number() for task selection.
+    Uses get_valid_task_number() for task selection.
     """
     my_username = get_validated_input("Enter your username: ", validate_non_empty, "Username")
     
     try:
-        all_tasks = read_all_tasks()
-        user_tasks = [t for t in all_tasks if t[1] == my_username]
+        user_tasks = tasks_for(my_username)
         
         print_header(f"MY TASKS - {my_username.upper()}")
         
@@ -679,29 +1178,25 @@ def view_my_tasks():
             return
         
         # Display all user tasks
-        for task_id, username, title, description, due_date, assigned_date, complete in user_tasks:
-            display_task_for_user(task_id, username, title, description, due_date, assigned_date, complete)
-        print(f"  Total tasks assigned to you: {len(user_tasks)}")
-        print()
+        lines = [format_task_for_user(*task_data) for task_data in user_tasks]
+        lines.append(f"  Total tasks assigned to you: {len(user_tasks)}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        # Keep the session's tasks keyed by ID; edits below update this
+        # mapping in place instead of re-reading task.txt
+        my_tasks = {t[0]: t for t in user_tasks}
         
         # Allow user to select a task for status update or editing
         while True:
-            # Use recursive function to get valid task number
-            task_id_selection = get_valid_task_number(user_tasks)
+            task_id_selection = get_valid_task_number(my_tasks.keys())
             
-            # Base case: User entered -1 to return to main menu
+            # User entered -1 to return to main menu
             if task_id_selection is None:
                 break
             
-            # Find the selected task
-            selected_task = None
-            for task_id, username, title, description, due_date, assigned_date, complete in user_tasks:
-                if task_id == task_id_selection:
-                    selected_task = (task_id, username, title, description, due_date, assigned_date, complete)
-                    break
-            
             # Display task action menu
-            task_id, username, title, description, due_date, assigned_date, complete = selected_task
+            task_id, username, title, description, due_date, assigned_date, complete = my_tasks[task_id_selection]
             print_header(f"TASK OPTIONS - {title}")
             print(f"  Current Status: {complete}")
             print()
@@ -716,29 +1211,22 @@ def view_my_tasks():
             
             if action_menu == '1':
                 # Update completion status
-                new_status = "No" if complete == "Yes" else "Yes"
+                new_status = "No" if task_status(task_id) == "yes" else "Yes"
                 # Update the task in the file
                 try:
-                    all_file_tasks = read_all_tasks()
-                    updated_tasks = []
-                    for task_tuple in all_file_tasks:
-                        tid, uname, ttitle, tdesc, tdue, tassigned, tstatus = task_tuple
-                        if tid == task_id:
-                            tstatus = new_status
-                        updated_tasks.append((tid, uname, ttitle, tdesc, tdue, tassigned, tstatus))
-                    
-                    write_all_tasks(updated_tasks)
-                    
-                    print_header("SUCCESS")
-                    print(f"  Task '{title}' has been marked as {'complete' if new_status == 'Yes' else 'incomplete'}!")
-                    print()
-                    logging.info(f"Task ID {task_id} status updated to {new_status}")
+                    updated_task = patch_task(task_id, complete=new_status)
+                    if updated_task is not None:
+                        my_tasks[task_id] = updated_task
+                        print_header("SUCCESS")
+                        print(f"  Task '{title}' has been marked as {'complete' if new_status == 'Yes' else 'incomplete'}!")
+                        print()
+                        logging.info(f"Task ID {task_id} status updated to {new_status}")
                 except IOError as e:
                     handle_file_error("updating task status", e)
             
             elif action_menu == '2':
                 # Edit task (only if not completed)
-                if complete.strip().lower() == "yes":
+                if task_status(task_id) == "yes":
                     print_header("ERROR")
                     print("  Cannot edit a completed task. Please mark it as incomplete first.")
                     print()
@@ -781,21 +1269,9 @@ def view_my_tasks():
                     if edit_options in ['1', '2', '3']:
                         # Update the task in the file
                         try:
-                            all_file_tasks = read_all_tasks()
-                            updated_tasks = []
-                            task_updated = False
-                            
-                            for task_tuple in all_file_tasks:
-                                tid, uname, ttitle, tdesc, tdue, tassigned, tstatus = task_tuple
-                                if tid == task_id:
-                                    uname = new_username
-                                    tdue = new_due_date
-                                    task_updated = True
-                                updated_tasks.append((tid, uname, ttitle, tdesc, tdue, tassigned, tstatus))
+                            updated_task = patch_task(task_id, username=new_username, due_date=new_due_date)
                             
-                            if task_updated:
-                                write_all_tasks(updated_tasks)
-                                
+                            if updated_task is not None:
                                 print_header("SUCCESS")
                                 print(f"  Task '{title}' has been updated!")
                                 if new_username != username:
@@ -805,18 +1281,15 @@ def view_my_tasks():
                                 print()
                                 logging.info(f"Task ID {task_id} updated - User: {new_username}, Due: {new_due_date}")
                                 
-                                # Reload tasks for the current user
-                                all_tasks = read_all_tasks()
-                                user_tasks = [t for t in all_tasks if t[1] == my_username]
-                                
-                                # Re-display tasks
-                                print_header(f"MY TASKS - {my_username.upper()}")
-                                if len(user_tasks) == 0:
-                                    print(f"  No tasks found for user '{my_username}'.")
+                                # Update the session's tasks and show only the changed row
+                                if new_username == my_username:
+                                    my_tasks[task_id] = updated_task
+                                    print_header(f"UPDATED TASK - {my_username.upper()}")
+                                    print(format_task_for_user(*updated_task))
                                 else:
-                                    for t_id, t_user, t_title, t_desc, t_due, t_assigned, t_complete in user_tasks:
-                                        display_task_for_user(t_id, t_user, t_title, t_desc, t_due, t_assigned, t_complete)
-                                    print(f"  Total tasks assigned to you: {len(user_tasks)}")
+                                    del my_tasks[task_id]
+                                    print(f"  Task ID {task_id} is no longer assigned to you.")
+                                print(f"  Total tasks assigned to you: {len(my_tasks)}")
                                 print()
                         except IOError as e:
                             handle_file_error("updating task", e)
@@ -828,8 +1301,7 @@ def view_my_tasks():
                 print("  Error: Invalid choice. Please enter 1, 2, or 3.")
             
             # Ask if user wants to select another task
-            another = input("  Select another task? (y/n): ").strip().lower()
-            if another != 'y':
+            if not ask_yes_no("  Select another task? (y/n): "):
                 break
     
     except FileNotFoundError:
@@ -842,10 +1314,8 @@ def view_my_tasks():
 
 # ...existing code...
 
-def display_menu():
-    print_header("MAIN MENU")
-    menu = input(
-        '''  r - Register a user
+# ===== Menu Prompts =====
+_MAIN_PROMPT = '''  r - Register a user
   a - Add task
   va - View all tasks
   vm - View my tasks
@@ -856,13 +1326,8 @@ def display_menu():
   e - Exit
 
   Enter your choice: '''
-    ).lower()
-    return menu
 
-def display_admin_menu():
-    print_header(f"ADMIN MENU")
-    menu = input(
-        '''  r - Register a user (Admin only)
+_ADMIN_PROMPT = '''  r - Register a user (Admin only)
   a - Add task
   va - View all tasks
   vm - View my tasks
@@ -878,13 +1343,8 @@ def display_admin_menu():
   e - Exit
 
   Enter your choice: '''
-    ).lower()
-    return menu
 
-def display_non_admin_menu():
-    print_header(f"USER MENU")
-    menu = input(
-        '''  a - Add task
+_USER_PROMPT = '''  a - Add task
   va - View all tasks
   vm - View my tasks
   uc - Update task completion status
@@ -894,8 +1354,185 @@ def display_non_admin_menu():
   e - Exit
 
   Enter your choice: '''
-    ).lower()
-    return menu
+
+
+def display_menu():
+    print_header("MAIN MENU")
+    return input(_MAIN_PROMPT).casefold()
+
+def display_admin_menu():
+    print_header("ADMIN MENU")
+    return input(_ADMIN_PROMPT).casefold()
+
+def display_non_admin_menu():
+    print_header("USER MENU")
+    return input(_USER_PROMPT).casefold()
+
+
+# user_overview.txt entry for a user with no assigned tasks
+_NO_TASKS_USER_REPORT = (
+    "User: {user}\n"
+    "  Total tasks assigned: 0\n"
+    "  Percentage of total tasks: 0.00%\n"
+    "  Percentage of assigned tasks completed: 0.00%\n"
+    "  Percentage of assigned tasks incomplete: 0.00%\n"
+    "  Percentage of assigned tasks overdue: 0.00%\n"
+    "\n"
+)
+
+
+def _aggregate_tasks(cache, current_date):
+    """
+    Count total, completed and overdue tasks overall and per user.
+    Works column-wise on the cache's username, status and due-date columns:
+    per-user totals come straight from the by_user index, and completed /
+    overdue counts are grouped by username with Counter over compress(),
+    so the only per-row Python work is building the overdue flags.
+    
+    Args:
+        cache: Task cache returned by _load_tasks()
+        current_date: Date used to decide whether a task is overdue
+        
+    Returns:
+        (totals, per_user): Counters with 'total', 'completed' and 'overdue'
+        keys, overall and keyed by username
+    """
+    stats = cache["stats"]
+    if stats is not None and stats[0] == current_date:
+        return stats[1], stats[2]
+    
+    usernames = cache["users"]
+    statuses = cache["status"]
+    overdue_flags = [status == "no" and due_date is not None and due_date < current_date
+                     for status, due_date in zip(statuses, _due_dates(cache))]
+    completed_counts = Counter(compress(usernames, map("yes".__eq__, statuses)))
+    overdue_counts = Counter(compress(usernames, overdue_flags))
+    
+    per_user = {}
+    for username, indices in cache["by_user"].items():
+        per_user[username] = Counter(
+            total=len(indices),
+            completed=completed_counts[username],
+            overdue=overdue_counts[username],
+        )
+    
+    totals = Counter(
+        total=len(statuses),
+        completed=sum(completed_counts.values()),
+        overdue=sum(overdue_counts.values()),
+    )
+    cache["stats"] = (current_date, totals, per_user)
+    return totals, per_user
+
+
+def _update_stats(cache, index, old_status):
+    """
+    Apply a single row's status change to the memoized report statistics,
+    so a status flip does not force a full re-aggregation.
+    
+    Args:
+        cache: Task cache whose "status" column already holds the new value
+        index (int): Row index of the changed task
+        old_status (str): The row's previous normalized status
+    """
+    stats = cache["stats"]
+    if stats is None:
+        return
+    current_date, totals, per_user = stats
+    due_date = _due_dates(cache)[index]
+    is_late = due_date is not None and due_date < current_date
+    user_counts = per_user[cache["users"][index]]
+    for status, sign in ((old_status, -1), (cache["status"][index], 1)):
+        if status == "yes":
+            totals["completed"] += sign
+            user_counts["completed"] += sign
+        elif status == "no" and is_late:
+            totals["overdue"] += sign
+            user_counts["overdue"] += sign
+
+
+def _write_task_overview(totals):
+    """
+    Build task_overview.txt in memory and write it in one go.
+    
+    Args:
+        totals (Counter): Overall counts from _aggregate_tasks()
+    """
+    # Calculate task statistics
+    total_tasks = totals["total"]
+    completed_tasks = totals["completed"]
+    incomplete_tasks = total_tasks - completed_tasks
+    overdue_tasks = totals["overdue"]
+    
+    # Calculate percentages
+    incomplete_pct = (incomplete_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    overdue_pct = (overdue_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    
+    task_lines = [
+        "=" * 70 + "\n",
+        "TASK OVERVIEW REPORT\n",
+        "=" * 70 + "\n\n",
+        f"Total number of tasks tracked: {total_tasks}\n",
+        f"Total number of completed tasks: {completed_tasks}\n",
+        f"Total number of uncompleted tasks: {incomplete_tasks}\n",
+        f"Total number of uncompleted and overdue tasks: {overdue_tasks}\n",
+        f"Percentage of incomplete tasks: {incomplete_pct:.2f}%\n",
+        f"Percentage of overdue tasks: {overdue_pct:.2f}%\n",
+        "=" * 70 + "\n",
+    ]
+    _atomic_write_bytes(TASK_OVERVIEW_FILE, "".join(task_lines).encode("utf-8"))
+
+
+def _write_user_overview(users, totals, per_user):
+    """
+    Build user_overview.txt in memory and write it in one go.
+    
+    Args:
+        users (list): Usernames to report on, in file order
+        totals (Counter): Overall counts from _aggregate_tasks()
+        per_user (dict): Per-user counts from _aggregate_tasks()
+    """
+    total_tasks = totals["total"]
+    user_lines = [
+        "=" * 70 + "\n",
+        "USER OVERVIEW REPORT\n",
+        "=" * 70 + "\n\n",
+        f"Total number of users registered: {len(users)}\n",
+        f"Total number of tasks tracked: {total_tasks}\n",
+        "\n" + "-" * 70 + "\n",
+        "USER TASK STATISTICS:\n",
+        "-" * 70 + "\n\n",
+    ]
+    
+    for user in users:
+        # Users with no tasks skip the statistics entirely
+        if user not in per_user:
+            user_lines.append(_NO_TASKS_USER_REPORT.format(user=user))
+            continue
+        
+        user_counts = per_user[user]
+        user_task_count = user_counts["total"]
+        user_completed = user_counts["completed"]
+        user_incomplete = user_task_count - user_completed
+        user_overdue = user_counts["overdue"]
+        
+        user_task_pct = (user_task_count / total_tasks * 100) if total_tasks > 0 else 0
+        user_completed_pct = (user_completed / user_task_count * 100) if user_task_count > 0 else 0
+        user_incomplete_pct = (user_incomplete / user_task_count * 100) if user_task_count > 0 else 0
+        user_overdue_pct = (user_overdue / user_task_count * 100) if user_task_count > 0 else 0
+        
+        user_lines.append(
+            f"User: {user}\n"
+            f"  Total tasks assigned: {user_task_count}\n"
+            f"  Percentage of total tasks: {user_task_pct:.2f}%\n"
+            f"  Percentage of assigned tasks completed: {user_completed_pct:.2f}%\n"
+            f"  Percentage of assigned tasks incomplete: {user_incomplete_pct:.2f}%\n"
+            f"  Percentage of assigned tasks overdue: {user_overdue_pct:.2f}%\n"
+            "\n"
+        )
+    
+    user_lines.append("=" * 70 + "\n")
+    _atomic_write_bytes(USER_OVERVIEW_FILE, "".join(user_lines).encode("utf-8"))
 
 
 def generate_reports():
@@ -904,85 +1541,13 @@ def generate_reports():
     Creates comprehensive statistics about tasks and users in the system.
     """
     try:
-        # Read all tasks
-        tasks = read_all_tasks()
-        
-        # Calculate task statistics
-        total_tasks = len(tasks)
-        completed_tasks = sum(1 for t in tasks if t[6].strip().lower() == "yes")
-        incomplete_tasks = total_tasks - completed_tasks
-        
-        # Check overdue incomplete tasks
-        current_date = datetime.now().date()
-        overdue_tasks = 0
-        for task in tasks:
-            if task[6].strip().lower() == "no":
-                try:
-                    due_date = datetime.strptime(task[4], "%Y-%m-%d").date()
-                    if due_date < current_date:
-                        overdue_tasks += 1
-                except ValueError:
-                    continue
-        
-        # Calculate percentages
-        incomplete_pct = (incomplete_tasks / total_tasks * 100) if total_tasks > 0 else 0
-        overdue_pct = (overdue_tasks / total_tasks * 100) if total_tasks > 0 else 0
-        
-        # Write task_overview.txt
-        with open(TASK_OVERVIEW_FILE, "w") as report:
-            report.write("=" * 70 + "\n")
-            report.write("TASK OVERVIEW REPORT\n")
-            report.write("=" * 70 + "\n\n")
-            report.write(f"Total number of tasks tracked: {total_tasks}\n")
-            report.write(f"Total number of completed tasks: {completed_tasks}\n")
-            report.write(f"Total number of uncompleted tasks: {incomplete_tasks}\n")
-            report.write(f"Total number of uncompleted and overdue tasks: {overdue_tasks}\n")
-            report.write(f"Percentage of incomplete tasks: {incomplete_pct:.2f}%\n")
-            report.write(f"Percentage of overdue tasks: {overdue_pct:.2f}%\n")
-            report.write("=" * 70 + "\n")
-        
-        # Generate user_overview.txt
-        with open(USER_FILE, "r") as user_file:
-            users = []
-            for line in user_file:
-                user_data = line.strip().split(", ")
-                if len(user_data) == 3:
-                    users.append(user_data[0])
+        # Read all tasks and aggregate them once for both reports
+        current_date = _today()
+        totals, per_user = _aggregate_tasks(_load_tasks(), current_date)
+        users = [username for username, (_, role) in _load_users().items() if role is not None]
         
-        total_users = len(users)
-        
-        with open(USER_OVERVIEW_FILE, "w") as report:
-            report.write("=" * 70 + "\n")
-            report.write("USER OVERVIEW REPORT\n")
-            report.write("=" * 70 + "\n\n")
-            report.write(f"Total number of users registered: {total_users}\n")
-            report.write(f"Total number of tasks tracked: {total_tasks}\n")
-            report.write("\n" + "-" * 70 + "\n")
-            report.write("USER TASK STATISTICS:\n")
-            report.write("-" * 70 + "\n\n")
-            
-            for user in users:
-                user_tasks = [t for t in tasks if t[1] == user]
-                user_task_count = len(user_tasks)
-                user_completed = sum(1 for t in user_tasks if t[6].strip().lower() == "yes")
-                user_incomplete = user_task_count - user_completed
-                user_overdue = sum(1 for t in user_tasks if t[6].strip().lower() == "no" and 
-                                  datetime.strptime(t[4], "%Y-%m-%d").date() < current_date)
-                
-                user_task_pct = (user_task_count / total_tasks * 100) if total_tasks > 0 else 0
-                user_completed_pct = (user_completed / user_task_count * 100) if user_task_count > 0 else 0
-                user_incomplete_pct = (user_incomplete / user_task_count * 100) if user_task_count > 0 else 0
-                user_overdue_pct = (user_overdue / user_task_count * 100) if user_task_count > 0 else 0
-                
-                report.write(f"User: {user}\n")
-                report.write(f"  Total tasks assigned: {user_task_count}\n")
-                report.write(f"  Percentage of total tasks: {user_task_pct:.2f}%\n")
-                report.write(f"  Percentage of assigned tasks completed: {user_completed_pct:.2f}%\n")
-                report.write(f"  Percentage of assigned tasks incomplete: {user_incomplete_pct:.2f}%\n")
-                report.write(f"  Percentage of assigned tasks overdue: {user_overdue_pct:.2f}%\n")
-                report.write("\n")
-            
-            report.write("=" * 70 + "\n")
+        _write_task_overview(totals)
+        _write_user_overview(users, totals, per_user)
         
         print_header("SUCCESS")
         print("  Reports generated successfully!")
@@ -1000,14 +1565,37 @@ def generate_reports():
         handle_file_error("generating reports", e)
 
 
+def _reports_fresh():
+    """
+    Check whether the report files are up to date.
+    Reports are fresh if both exist, are newer than task.txt and user.txt,
+    and were generated today (overdue counts depend on the current date).
+    
+    Returns:
+        bool: True if the existing reports can be shown as-is
+    """
+    try:
+        report_mtime = min(os.path.getmtime(TASK_OVERVIEW_FILE), os.path.getmtime(USER_OVERVIEW_FILE))
+    except OSError:
+        return False
+    source_mtimes = [0]
+    for filename in (TASK_FILE, USER_FILE):
+        try:
+            source_mtimes.append(os.path.getmtime(filename))
+        except OSError:
+            pass
+    return (report_mtime >= max(source_mtimes)
+            and datetime.fromtimestamp(report_mtime).date() == _today())
+
+
 def display_statistics():
     """
     Display statistics from report files in user-friendly format.
-    Generates reports if they don't exist first.
+    Generates reports first if they don't exist or are out of date.
     """
-    # Generate reports if they don't exist
-    if not os.path.exists(TASK_OVERVIEW_FILE) or not os.path.exists(USER_OVERVIEW_FILE):
-        print("  Report files not found. Generating reports first...\n")
+    # Generate reports only if they are missing or stale
+    if not _reports_fresh():
+        print("  Report files missing or out of date. Generating reports first...\n")
         generate_reports()
     
     try:
@@ -1042,30 +1630,17 @@ def update_task_complete():
     task_id = get_validated_input("Enter the task ID to mark as complete: ", validate_non_empty, "Task ID")
     
     try:
-        tasks = read_all_tasks()
-        
-        task_found = False
-        updated_tasks = []
+        task = find_task(task_id)
         
-        for task_data in tasks:
-            tid, username, title, description, due_date, assigned_date, complete = task_data
-            
-            if tid == task_id:
-                complete = "Yes"
-                task_found = True
-                print_header("SUCCESS")
-                print(f"  Task ID {task_id} ('{title}') has been marked as complete!")
-                print()
-                logging.info(f"Task ID {task_id} marked as complete")
-            
-            updated_tasks.append((tid, username, title, description, due_date, assigned_date, complete))
-        
-        if task_found:
-            write_all_tasks(updated_tasks)
-        else:
+        if task is None:
             print_header("ERROR")
             print(f"  Task ID '{task_id}' not found.")
             print()
+        elif patch_task(task_id, complete="Yes") is not None:
+            print_header("SUCCESS")
+            print(f"  Task ID {task_id} ('{task[2]}') has been marked as complete!")
+            print()
+            logging.info(f"Task ID {task_id} marked as complete")
     
     except IOError as e:
         handle_file_error("updating task", e)
@@ -1081,36 +1656,22 @@ def reset_task_incomplete():
     task_id = get_validated_input("Enter the task ID to reset to incomplete: ", validate_non_empty, "Task ID")
     
     try:
-        all_tasks = read_all_tasks()
-        task_found = False
-        updated_tasks = []
+        task = find_task(task_id)
         
-        for task_tuple in all_tasks:
-            tid, username, title, description, due_date, assigned_date, complete = task_tuple
-            
-            if tid == task_id:
-                if complete.strip().lower() == "yes":
-                    complete = "No"
-                    task_found = True
-                    print_header("SUCCESS")
-                    print(f"  Task ID {task_id} ('{title}') has been reset to incomplete!")
-                    print()
-                    logging.info(f"Task ID {task_id} reset to incomplete")
-                else:
-                    print_header("INFO")
-                    print(f"  Task ID {task_id} ('{title}') is already incomplete.")
-                    print()
-            
-            updated_tasks.append((tid, username, title, description, due_date, assigned_date, complete))
-        
-        if task_found:
-            write_all_tasks(updated_tasks)
-        
-        if not task_found:
+        if task is None:
             print_header("ERROR")
             print(f"  Task ID '{task_id}' not found.")
             print()
             logging.warning(f"Attempt to reset non-existent task ID {task_id}")
+        elif task_status(task_id) != "yes":
+            print_header("INFO")
+            print(f"  Task ID {task_id} ('{task[2]}') is already incomplete.")
+            print()
+        elif patch_task(task_id, complete="No") is not None:
+            print_header("SUCCESS")
+            print(f"  Task ID {task_id} ('{task[2]}') has been reset to incomplete!")
+            print()
+            logging.info(f"Task ID {task_id} reset to incomplete")
     
     except FileNotFoundError:
         print_header("ERROR")
@@ -1121,35 +1682,48 @@ def reset_task_incomplete():
         handle_file_error("resetting task", e)
 
 
+def _task_line_matches(line, task_identifier):
+    """
+    Check whether a raw task.txt line is a task with the given ID or title.
+    Only the leading fields are split unless the line looks like a match.
+    """
+    fields = line.strip().split(", ", 3)
+    if fields[0] != task_identifier and (len(fields) < 3 or fields[2] != task_identifier):
+        return False
+    return len(line.strip().split(", ")) == 7
+
+
 def delete_task():
     """
     Delete a task from task.txt (Admin only).
     Prompts for task ID or task title to identify and delete the task.
-    Creates backup before deletion.
+    The file is streamed line by line into a temporary file, skipping the
+    matching task, then swapped in atomically; other lines are copied
+    through untouched. Creates backup before deletion, only if a task matches.
     """
     print_header("DELETE TASK")
     
     task_identifier = input("Enter the task ID or task title to delete: ").strip()
+    tmp_name = TASK_FILE + ".tmp"
     
     try:
-        backup_file(TASK_FILE)
-        tasks = read_all_tasks()
-        
-        found = False
-        deleted_task_info = ""
-        updated_tasks = []
-        
-        for task_data in tasks:
-            task_id, username, title, description, due_date, assigned_date, complete = task_data
-            # Match by task ID or task title
-            if task_id == task_identifier or title == task_identifier:
-                found = True
-                deleted_task_info = f"Task ID {task_id} ('{title}')"
-                continue
-            updated_tasks.append(task_data)
+        deleted_lines = []
+        if task_identifier:
+            with open(TASK_FILE, "r") as src, open(tmp_name, "w") as dst:
+                for line in src:
+                    # Match by task ID or task title
+                    if _task_line_matches(line, task_identifier):
+                        deleted_lines.append(line)
+                    else:
+                        dst.write(line)
+                dst.flush()
+                os.fsync(dst.fileno())
         
-        if found:
-            write_all_tasks(updated_tasks)
+        if deleted_lines:
+            task_id, _, title = deleted_lines[0].strip().split(", ", 3)[:3]
+            deleted_task_info = f"Task ID {task_id} ('{title}')"
+            backup_file(TASK_FILE)
+            os.replace(tmp_name, TASK_FILE)
             print_header("SUCCESS")
             print(f"  {deleted_task_info} has been deleted.")
             print()
@@ -1158,8 +1732,15 @@ def delete_task():
             print_header("ERROR")
             print(f"  Task '{task_identifier}' not found.")
             print()
+    except FileNotFoundError:
+        print_header("ERROR")
+        print(f"  Task '{task_identifier}' not found.")
+        print()
     except Exception as e:
         handle_file_error("deleting task", e)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
 
 
 def view_completed_tasks():
@@ -1168,18 +1749,19 @@ def view_completed_tasks():
     Displays tasks with 'Yes' completion status.
     """
     try:
-        tasks = read_all_tasks()
-        completed_tasks = [t for t in tasks if t[6].strip().lower() == "yes"]
+        # Select rows by the cached status column; only matches are formatted
+        cache = _load_tasks()
+        completed_tasks = compress(cache["rows"], map("yes".__eq__, cache["status"]))
+        lines = [format_task(*task_data) for task_data in completed_tasks]
         
         print_header("COMPLETED TASKS")
         
-        if len(completed_tasks) == 0:
-            print("  No completed tasks found.")
+        if len(lines) == 0:
+            lines.append("  No completed tasks found.")
         else:
-            for task_id, username, title, description, due_date, assigned_date, complete in completed_tasks:
-                display_task(task_id, username, title, description, due_date, assigned_date, complete)
-            print(f"  Total completed tasks: {len(completed_tasks)}")
-        print()
+            lines.append(f"  Total completed tasks: {len(lines)}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     except IOError as e:
         print_header("ERROR")
         print(f"  Error reading tasks: {e}")
@@ -1187,6 +1769,35 @@ def view_completed_tasks():
         logging.error(f"Error reading completed tasks: {e}")
 
 
+def generate_reports_from_menu():
+    """
+    Generate reports and list the report files (menu option 'gr').
+    """
+    generate_reports()
+    print("  Reports generated successfully!")
+    print(f"    - {TASK_OVERVIEW_FILE}")
+    print(f"    - {USER_OVERVIEW_FILE}")
+    print()
+
+
+# ===== Menu Dispatch =====
+# menu code -> (handler, admin_only, header printed before the handler, error shown to non-admins)
+MENU_HANDLERS = {
+    'r': (register_user, True, "REGISTER NEW USER", "Only Admin users can register new users."),
+    'a': (add_task, False, "ADD NEW TASK", None),
+    'va': (view_all_tasks, False, None, None),
+    'vm': (view_my_tasks, False, None, None),
+    'vu': (view_all_users, True, None, "Only Admin users can view all users."),
+    'vr': (verify_and_update_user_roles, True, None, "Only Admin users can verify and update roles."),
+    'dt': (delete_task, True, None, "Only Admin users can delete tasks."),
+    'vc': (view_completed_tasks, True, None, "Only Admin users can view completed tasks."),
+    'uc': (update_task_complete, False, "UPDATE TASK COMPLETION STATUS", None),
+    'rc': (reset_task_incomplete, True, "RESET TASK TO INCOMPLETE", "Only Admin users can reset completed tasks to incomplete."),
+    'gr': (generate_reports_from_menu, True, "GENERATING REPORTS", "Only Admin users can generate reports."),
+    'ds': (display_statistics, True, "TASK MANAGER STATISTICS", "Only Admin users can view statistics."),
+}
+
+
 def main():
     """
     Main program loop with role-based access control.
@@ -1206,97 +1817,16 @@ def main():
                 break
         
         # User session loop
+        is_admin = current_user.role.casefold() == "admin"
         user_logged_in = True
         while user_logged_in:
             # Display menu based on user role
-            if current_user.role.lower() == "admin":
+            if is_admin:
                 menu = display_admin_menu()
             else:
                 menu = display_non_admin_menu()
             
-            if menu == 'r':
-                # Register user - Admin only
-                if current_user.role.lower() == "admin":
-                    print_header("REGISTER NEW USER")
-                    register_user()
-                else:
-                    print("\n  ERROR: Only Admin users can register new users.\n")
-            
-            elif menu == 'a':
-                # Add task - Available to all
-                print_header("ADD NEW TASK")
-                add_task()
-            
-            elif menu == 'va':
-                # View all tasks - Now available to all users
-                view_all_tasks()
-            
-            elif menu == 'vm':
-                # View my tasks - Available to all
-                view_my_tasks()
-            
-            elif menu == 'vu':
-                # View all users - Admin only
-                if current_user.role.lower() == "admin":
-                    view_all_users()
-                else:
-                    print("\n  ERROR: Only Admin users can view all users.\n")
-            
-            elif menu == 'vr':
-                # Verify and update roles - Admin only
-                if current_user.role.lower() == "admin":
-                    verify_and_update_user_roles()
-                else:
-                    print("\n  ERROR: Only Admin users can verify and update roles.\n")
-            
-            elif menu == 'dt':
-                # Delete task - Admin only
-                if current_user.role.lower() == "admin":
-                    delete_task()
-                else:
-                    print("\n  ERROR: Only Admin users can delete tasks.\n")
-            
-            elif menu == 'vc':
-                # View completed tasks - Admin only
-                if current_user.role.lower() == "admin":
-                    view_completed_tasks()
-                else:
-                    print("\n  ERROR: Only Admin users can view completed tasks.\n")
-            
-            elif menu == 'uc':
-                # Update task completion status - Available to all users
-                print_header("UPDATE TASK COMPLETION STATUS")
-                update_task_complete()
-            
-            elif menu == 'rc':
-                # Reset completed task to incomplete - Admin only
-                if current_user.role.lower() == "admin":
-                    print_header("RESET TASK TO INCOMPLETE")
-                    reset_task_incomplete()
-                else:
-                    print("\n  ERROR: Only Admin users can reset completed tasks to incomplete.\n")
-            
-            elif menu == 'gr':
-                # Generate reports - Admin only
-                if current_user.role.lower() == "admin":
-                    print_header("GENERATING REPORTS")
-                    generate_reports()
-                    print("  Reports generated successfully!")
-                    print(f"    - {TASK_OVERVIEW_FILE}")
-                    print(f"    - {USER_OVERVIEW_FILE}")
-                    print()
-                else:
-                    print("\n  ERROR: Only Admin users can generate reports.\n")
-            
-            elif menu == 'ds':
-                # Display statistics - Admin only
-                if current_user.role.lower() == "admin":
-                    print_header("TASK MANAGER STATISTICS")
-                    display_statistics()
-                else:
-                    print("\n  ERROR: Only Admin users can view statistics.\n")
-            
-            elif menu == 'lo':
+            if menu == 'lo':
                 # Logout
                 print_header("LOGOUT")
                 print(f"  Goodbye, {current_user.username}!")
@@ -1308,7 +1838,16 @@ def main():
                 print_header("THANK YOU")
                 print("  Goodbye!!!")
                 print()
-                exit()
+                return
+            
+            elif menu in MENU_HANDLERS:
+                handler, admin_only, header, denied_message = MENU_HANDLERS[menu]
+                if admin_only and not is_admin:
+                    print(f"\n  ERROR: {denied_message}\n")
+                else:
+                    if header:
+                        print_header(header)
+                    handler()
             
             else:
                 print("\n  ERROR: You have entered an invalid input. Please try again.\n")